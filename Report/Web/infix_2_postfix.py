@@ -1,6 +1,9 @@
+import re
 import streamlit as st
 import time
-from typing import List
+from functools import lru_cache
+from typing import List, NamedTuple, Tuple
+from stack import Stack
 
 def is_operator(token: str) -> bool:
     return len(token) == 1 and token in "+-*/"
@@ -12,44 +15,24 @@ def is_valid_number(token: str) -> bool:
         return token[1:].isdigit()
     return token.isdigit()
 
+TOKEN_PATTERN = re.compile(r"(?P<space>\s+)|(?P<number>-?\d+)|(?P<char>.)", re.DOTALL)
+
 def tokenize(expression: str) -> List[str]:
     tokens = []
-    index = 0
-    length = len(expression)
-    
-    while index < length:
-        # Skip whitespace
-        if expression[index].isspace():
-            index += 1
-            continue
-
-        # Handle numbers (including negative numbers)
-        if expression[index].isdigit() or (
-            expression[index] == '-' 
-            and index + 1 < length 
-            and expression[index + 1].isdigit()
-        ):
-            number = ""
-            if expression[index] == '-':
-                number += '-'
-                index += 1
-            while index < length and expression[index].isdigit():
-                number += expression[index]
-                index += 1
-            tokens.append(number)
-
-        else:
-            # Handle unary minus: e.g., "-x" or "(-5)"
-            if expression[index] == '-':
-                if not tokens or tokens[-1] == "(" or is_operator(tokens[-1]):
-                    tokens.append("0")
-                    tokens.append("-")
-                    index += 1
-                    continue
-
-            # Default: treat as a single-character token (operator, parenthesis, etc.)
-            tokens.append(expression[index])
-            index += 1
+    for match in TOKEN_PATTERN.finditer(expression):
+        kind = match.lastgroup
+        # Numbers, including negative numbers such as "-5"
+        if kind == "number":
+            tokens.append(match.group())
+        elif kind == "char":
+            char = match.group()
+            # Handle unary minus: e.g., "-x" or "(-x)"
+            if char == '-' and (not tokens or tokens[-1] == "(" or is_operator(tokens[-1])):
+                tokens.append("0")
+                tokens.append("-")
+            else:
+                # Default: treat as a single-character token (operator, parenthesis, etc.)
+                tokens.append(char)
 
     return tokens
 
@@ -60,107 +43,181 @@ def precedence(op: str) -> int:
         return 2
     return 0
 
-def infix_to_postfix(infix: str) -> str:
+OP_NUMBER, OP_VARIABLE, OP_ADD, OP_SUB, OP_MUL, OP_DIV, OP_INVALID = range(7)
+OPERATOR_OPCODES = {"+": OP_ADD, "-": OP_SUB, "*": OP_MUL, "/": OP_DIV}
+
+
+class CompiledExpression(NamedTuple):
+    tokens: Tuple[str, ...]  # Infix tokens
+    output: Tuple[str, ...]  # Postfix tokens
+    conversion: Tuple[Tuple[int, str], ...]  # After each infix token: output length, operator stack
+    opcodes: bytes  # One opcode per postfix token
+    operands: Tuple  # Number value, variable name or invalid token; None for operators
+
+    @property
+    def postfix(self) -> str:
+        return " ".join(self.output)
+
+
+def _assemble(postfix_tokens) -> Tuple[bytes, Tuple]:
+    opcodes = bytearray()
+    operands = []
+    for token in postfix_tokens:
+        if is_valid_number(token):
+            opcodes.append(OP_NUMBER)
+            operands.append(int(token))
+        elif is_operator(token):
+            opcodes.append(OPERATOR_OPCODES[token])
+            operands.append(None)
+        elif token.isidentifier():
+            opcodes.append(OP_VARIABLE)
+            operands.append(token)
+        else:
+            # Reported when executed, so earlier operand errors still come first
+            opcodes.append(OP_INVALID)
+            operands.append(token)
+    return bytes(opcodes), tuple(operands)
+
+
+class CompileError(ValueError):
+    """Conversion error that keeps the program converted up to the failing token, for the step-by-step view"""
+    def __init__(self, message: str, program: CompiledExpression):
+        super().__init__(message)
+        self.program = program
+
+
+@lru_cache(maxsize=256)
+def compile_expression(infix: str) -> CompiledExpression:
+    """
+    Tokenize and convert infix to postfix once, and encode the postfix as opcode/operand arrays.
+    The output length and operator stack after each token are kept for the step-by-step view.
+    Results are cached by expression text, so repeated expressions skip parsing entirely.
+    Errors are raised as CompileError carrying the partial conversion.
+    """
     tokens = tokenize(infix)
-    stack = []
+    stack = Stack("char")
     output = []
-    with st.expander(f"Infix to postfix step-by-step", expanded=False):
-        for step, token in enumerate(tokens, 1):
-            if is_valid_number(token) or token.isidentifier():
-                output.append(token)
-            elif token == "(":
-                stack.append(token)
-            elif token == ")":
-                while stack and stack[-1] != "(":
-                    output.append(stack.pop())
-                if not stack:
-                    raise ValueError("Mismatched parentheses")
-                stack.pop()  # remove '('
-            elif is_operator(token):
-                while (
-                    stack 
-                    and is_operator(stack[-1]) 
-                    and precedence(stack[-1]) >= precedence(token)
-                ):
-                    output.append(stack.pop())
-                stack.append(token)
+    conversion = []
+
+    def _fail(message):
+        partial = CompiledExpression(tuple(tokens), tuple(output), tuple(conversion), b"", ())
+        return CompileError(message, partial)
+
+    for token in tokens:
+        if is_valid_number(token) or token.isidentifier():
+            output.append(token)
+        elif token == "(":
+            stack.push(token)
+        elif token == ")":
+            while stack and stack.peek() != "(":
+                output.append(stack.pop())
+            if not stack:
+                raise _fail("Mismatched parentheses")
+            stack.pop()  # remove '('
+        elif is_operator(token):
+            while stack and is_operator(stack.peek()) and precedence(stack.peek()) >= precedence(token):
+                output.append(stack.pop())
+            stack.push(token)
+        else:
+            raise _fail(f"Invalid token: {token}")
+        conversion.append((len(output), " ".join(stack)))
+
+    while stack:
+        if stack.peek() in "()":
+            raise _fail("Mismatched parentheses")
+        output.append(stack.pop())
+
+    opcodes, operands = _assemble(output)
+    return CompiledExpression(tuple(tokens), tuple(output), tuple(conversion), opcodes, operands)
+
+
+def run_program(program: CompiledExpression):
+    """Execute the bytecode, yielding (index, a, b, value, stack) after each instruction (a, b are None for pushes)"""
+    stack = Stack("int")
+    for index, (opcode, operand) in enumerate(zip(program.opcodes, program.operands)):
+        a = b = None
+        if opcode == OP_NUMBER:
+            value = operand
+        elif opcode == OP_VARIABLE:
+            value = 0  # Variables are assumed to be 0
+        elif opcode == OP_INVALID:
+            raise ValueError(f"Invalid token in postfix: {operand}")
+        else:
+            if len(stack) < 2:
+                raise ValueError("Invalid postfix expression: not enough operands")
+            b, a = stack.pop_many(2)
+            if opcode == OP_ADD:
+                value = a + b
+            elif opcode == OP_SUB:
+                value = a - b
+            elif opcode == OP_MUL:
+                value = a * b
             else:
-                raise ValueError(f"Invalid token: {token}")
-            
-            
+                if b == 0:
+                    raise ValueError("Division by zero")
+                value = a // b
+        stack.push(value)
+        yield index, a, b, value, stack
+
+    if len(stack) != 1:
+        raise ValueError("Invalid postfix expression: too many/few operands")
+
+
+def evaluate_compiled(program: CompiledExpression) -> int:
+    value = None
+    for _, _, _, value, _ in run_program(program):
+        pass
+    return value
+
+
+def infix_to_postfix(infix: str) -> str:
+    return compile_expression(infix).postfix
+
+
+def evaluate_postfix(postfix: str) -> int:
+    output = tuple(postfix.split())
+    opcodes, operands = _assemble(output)
+    return evaluate_compiled(CompiledExpression((), output, (), opcodes, operands))
+
+
+def render_conversion_steps(program: CompiledExpression):
+    with st.expander(f"Infix to postfix step-by-step", expanded=False):
+        for step, (token, (output_length, stack)) in enumerate(zip(program.tokens, program.conversion), 1):
             st.write(f"**Step** {step}: Read token `{token}`")
             col1, col2 = st.columns(2)
             with col1:
                 st.markdown("**Output:**")
-                st.code(" ".join(output) if output else "", language=None)
+                st.code(" ".join(program.output[:output_length]), language=None)
             with col2:
                 st.markdown("**Stack:**")
-                st.code(" ".join(stack) if stack else "", language=None)
+                st.code(stack, language=None)
             st.divider()
-            time.sleep(1.5) 
-
-    while stack:
-        if stack[-1] in "()":
-            raise ValueError("Mismatched parentheses")
-        output.append(stack.pop())
-
-    result = " ".join(output)
-    
-    return result
+            time.sleep(1.5)
 
-def evaluate_postfix(postfix: str) -> int:
-    stack = []
-    tokens = postfix.split()
 
+def render_evaluation_steps(program: CompiledExpression) -> int:
+    """Replay the evaluation; an error is raised at the failing instruction, after the steps before it"""
+    result = None
     with st.expander("Step-by-step Evaluation of Postfix", expanded=False):
-        for i, token in enumerate(tokens, 1):
-            action = ""
-            
-            if is_valid_number(token):
-                num = int(token)
-                stack.append(num)
-                action = f"Push number {num}"
-
-            elif is_operator(token):
-                if len(stack) < 2:
-                    raise ValueError("Invalid postfix expression: not enough operands")
-                b = stack.pop()
-                a = stack.pop()
-                if token == "+":
-                    res = a + b
-                elif token == "-":
-                    res = a - b
-                elif token == "*":
-                    res = a * b
-                elif token == "/":
-                    if b == 0:
-                        raise ValueError("Division by zero")
-                    res = a // b
-                stack.append(res)
-                action = f"Pop {a}, {b} → {a} {token} {b} = {res} → Push {res}"
-
+        for index, a, b, value, stack in run_program(program):
+            token = program.output[index]
+            opcode = program.opcodes[index]
+            if opcode == OP_NUMBER:
+                action = f"Push number {value}"
+            elif opcode == OP_VARIABLE:
+                action = f"Push variable '{token}' (assumed value = 0)"
             else:
-                if token.isidentifier():
-                    stack.append(0)
-                    action = f"Push variable '{token}' (assumed value = 0)"
-                else:
-                    raise ValueError(f"Invalid token in postfix: {token}")
+                action = f"Pop {a}, {b} → {a} {token} {b} = {value} → Push {value}"
 
-            st.markdown(f"**Step {i}**: Token = `{token}`")
+            st.markdown(f"**Step {index + 1}**: Token = `{token}`")
             st.caption(action)
-            st.write("**Stack:**", stack)
-            
-            
+            st.write("**Stack:**", stack.to_list())
             st.divider()
             time.sleep(1.5)
-
-        if len(stack) != 1:
-            raise ValueError("Invalid postfix expression: too many/few operands")
-
-        result = stack[0]
-
+            result = value
     return result
 
+
 def render_stack_tab():
     st.header("Infix to Postfix Expression Evaluator")
     st.write("""
@@ -179,18 +236,26 @@ def render_stack_tab():
             return
 
         try:
+            # Parsed once per distinct expression, the steps below are replayed from the compiled program
+            try:
+                program, error = compile_expression(expr), None
+            except CompileError as e:
+                program, error = e.program, e
+
             st.subheader("Step 1: Tokenization")
-            tokens = tokenize(expr)
+            tokens = list(program.tokens)
             with st.expander("View Tokens", expanded=False):
                 st.write("**Token list:**", tokens)
             st.code(" → ".join(f"'{t}'" for t in tokens), language="text")
 
             st.subheader("Step 2: Infix → Postfix Conversion")
-            postfix = infix_to_postfix(expr, )
-            st.code(postfix, language="text")
+            render_conversion_steps(program)
+            if error is not None:
+                raise error
+            st.code(program.postfix, language="text")
 
             st.subheader("Step 3: Postfix Evaluation")
-            result = evaluate_postfix(postfix, )
+            result = render_evaluation_steps(program)
 
             st.divider()
             st.subheader("Final Result")
@@ -1,5 +1,6 @@
 import streamlit as st
 import sys
+from stack import Stack
 
 def render_stack_tab():
     st.header("Example of Stack")
@@ -11,7 +12,7 @@ def render_stack_tab():
     
     # Initialize stack in session state
     if "array_stack" not in st.session_state:
-        st.session_state['array_stack'] = []
+        st.session_state['array_stack'] = Stack()
     
     if "last_operation" not in st.session_state:
         st.session_state['last_operation'] = ""
@@ -34,7 +35,7 @@ def render_stack_tab():
             # Push operation
             if st.button('Push', key='push', use_container_width=True):
                 if value and value.strip():
-                    st.session_state['array_stack'].append(value.strip())
+                    st.session_state['array_stack'].push(value.strip())
                     st.session_state['last_operation'] = f"[PUSH]: Added '{value.strip()}' to stack"
                     st.session_state['operation_result'] = "success"
                     st.rerun()
@@ -58,7 +59,7 @@ def render_stack_tab():
             # Peek operation
             if st.button('Peek', key='peek', use_container_width=True):
                 if st.session_state['array_stack']:
-                    top_value = st.session_state['array_stack'][-1]
+                    top_value = st.session_state['array_stack'].peek()
                     st.session_state['last_operation'] = f"[PEEK]: Top element is '{top_value}'"
                     st.session_state['operation_result'] = "info"
                 else:
@@ -85,7 +86,7 @@ def render_stack_tab():
         with btn_col6:
             # Clear stack operation
             if st.button('Clear Stack', key='clear', use_container_width=True):
-                st.session_state['array_stack'] = []
+                st.session_state['array_stack'].clear()
                 st.session_state['last_operation'] = "[CLEAR]: Cleared entire stack"
                 st.session_state['operation_result'] = "success"
         
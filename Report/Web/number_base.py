@@ -1,5 +1,6 @@
 import streamlit as st
 import time
+from stack import Stack
 
 def convert_base_with_steps(num, base):
     if num == 0:
@@ -9,7 +10,7 @@ def convert_base_with_steps(num, base):
         }]
 
     digits = "0123456789ABCDEF"
-    stack = []
+    stack = Stack("char")
     steps = []
     n = num
 
@@ -17,10 +18,10 @@ def convert_base_with_steps(num, base):
     while n > 0:
         remainder = n % base
         digit = digits[remainder]
-        stack.append(digit)
+        stack.push(digit)
         step = {
             'action': f"{n} divided by {base} → remainder {remainder} → push '{digit}'",
-            'stack': stack.copy(),
+            'stack': stack.to_list(),
             'result': ''
         }
         steps.append(step)
@@ -28,13 +29,14 @@ def convert_base_with_steps(num, base):
 
     # Pop process
     result = ""
-    temp_stack = stack.copy()
+    temp_stack = Stack("char")
+    temp_stack.push_many(stack)
     for _ in range(len(stack)):
         digit = temp_stack.pop()
         result += digit
         step = {
             'action': f"Pop '{digit}' → temporary result: `{result}`",
-            'stack': temp_stack.copy(),
+            'stack': temp_stack.to_list(),
             'result': result
         }
         steps.append(step)
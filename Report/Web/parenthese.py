@@ -1,29 +1,188 @@
+import os
+import re
 import streamlit as st
 import time
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from itertools import chain, islice
+from stack import Stack
+
+OPENING_BRACKETS = "({["
+BRACKET_PAIRS = {')': '(', '}': '{', ']': '['}
+BRACKET_PATTERN = re.compile(r"[(){}\[\]]")
+
+
+def validate_brackets(expr: str) -> int:
+    """
+    Validate-only mode: no steps are recorded.
+    Returns -1 if the expression is balanced, otherwise the position of the first error
+    (the offending closing bracket, or len(expr) when brackets are left open).
+    """
+    # Plain list in this hot loop: Stack's capacity/type checks would double the cost per bracket
+    stack = []
+    push, pop = stack.append, stack.pop
+    for match in BRACKET_PATTERN.finditer(expr):
+        char = match.group()
+        if char in OPENING_BRACKETS:
+            push(char)
+        elif not stack or pop() != BRACKET_PAIRS[char]:
+            return match.start()
+    return -1 if not stack else len(expr)
+
+
+NON_BRACKET_BYTES = bytes(b for b in range(256) if b not in b"(){}[]")
+BRACKET_BYTES_PATTERN = re.compile(rb"[(){}\[\]]")
+
+
+def _iter_chunks(source, chunk_size):
+    if hasattr(source, "read"):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+    else:
+        yield from source
+
+
+def validate_bracket_stream(source, chunk_size: int = 1 << 20) -> int:
+    """
+    Streaming version of validate_brackets for inputs that do not fit in memory.
+    source is a file object (text or binary) or an iterable of str/bytes chunks;
+    the stack is carried across chunks, so a bracket may open in one chunk and close in another.
+    Non-bracket bytes are dropped in bulk with bytes.translate before the Python loop.
+    Returns -1 if balanced, otherwise the global byte offset of the first error
+    (total bytes read when brackets are left open). Text is counted in UTF-8 bytes.
+    """
+    stack = Stack("char")
+    push, pop = stack.push, stack.pop
+    offset = 0
+    for chunk in _iter_chunks(source, chunk_size):
+        if isinstance(chunk, str):
+            chunk = chunk.encode("utf-8")
+        brackets = chunk.translate(None, NON_BRACKET_BYTES).decode("ascii")
+        for k, char in enumerate(brackets):
+            if char in OPENING_BRACKETS:
+                push(char)
+            elif not stack or pop() != BRACKET_PAIRS[char]:
+                # Locate the k-th bracket of the chunk only once an error is found
+                for j, match in enumerate(BRACKET_BYTES_PATTERN.finditer(chunk)):
+                    if j == k:
+                        return offset + match.start()
+        offset += len(chunk)
+    return -1 if not stack else offset
+
+
+def _validate_batch(expressions):
+    positions = array("q", map(validate_brackets, expressions))
+    return positions, sum(map(len, expressions))
+
+
+def _iter_batches(expressions, batch_size):
+    if hasattr(expressions, "read"):
+        expressions = (line.rstrip("\r\n") for line in expressions)
+    iterator = iter(expressions)
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def _map_bounded(executor, func, items, window):
+    """
+    Like executor.map, but at most window batches are submitted or waiting to be yielded,
+    so a large input is read lazily instead of being queued all at once. Results keep input order.
+    """
+    pending = {}  # future -> index
+    finished = {}  # index -> result that cannot be yielded yet
+    submitted = next_index = 0
+    items = iter(items)
+    exhausted = False
+    while not exhausted or pending or finished:
+        while not exhausted and len(pending) + len(finished) < window:
+            item = next(items, None)
+            if item is None:
+                exhausted = True
+            else:
+                pending[executor.submit(func, item)] = submitted
+                submitted += 1
+        if pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                finished[pending.pop(future)] = future.result()
+        while next_index in finished:
+            yield finished.pop(next_index)
+            next_index += 1
+
+
+def validate_brackets_batch(expressions, workers=None, batch_size: int = 10_000) -> dict:
+    """
+    Validate many expressions with validate_brackets (no steps are recorded).
+    expressions is a list of strings or a text file with one expression per line.
+    Batches are spread over a process pool of workers processes, with at most 2 * workers batches
+    in flight; workers=1 or an input that fits in one batch runs in-process.
+    Returns compact arrays: valid (array('b'), 1 = balanced) and error_position
+    (array('q'), -1 when valid), plus count, seconds and throughput.
+    """
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    positions = array("q")
+    characters = 0
+    batches = _iter_batches(expressions, batch_size)
+    head = list(islice(batches, 2))
+    batches = chain(head, batches)
+
+    def _collect(results):
+        nonlocal characters
+        for batch_positions, batch_characters in results:
+            positions.extend(batch_positions)
+            characters += batch_characters
+
+    if workers == 1 or len(head) < 2:
+        _collect(map(_validate_batch, batches))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            _collect(_map_bounded(executor, _validate_batch, batches, 2 * workers))
+
+    seconds = time.perf_counter() - start
+    return {
+        "valid": array("b", (position == -1 for position in positions)),
+        "error_position": positions,
+        "count": len(positions),
+        "characters": characters,
+        "seconds": seconds,
+        "expressions_per_second": len(positions) / seconds if seconds else float("inf"),
+        "characters_per_second": characters / seconds if seconds else float("inf"),
+    }
+
+
+def check_balanced_brackets(expr, trace=True):
+    """
+    Each step records only its delta (the bracket pushed or popped), so tracing is O(n).
+    Use replay_stack(steps) to rebuild the stack snapshots when they are shown.
+    With trace=False no steps are recorded and an empty list is returned.
+    """
+    if not trace:
+        return validate_brackets(expr) == -1, []
 
-def check_balanced_brackets(expr):
     if not expr.strip():
         return True, [{"message": "Empty expression - valid"}]
     
-    stack = []
-    bracket_pairs = {')': '(', '}': '{', ']': '['}
+    stack = Stack("char")
     steps = []
 
-    for i, char in enumerate(expr):
-        # Skip non-bracket characters
-        if char not in "(){}[]":
-            continue
-            
+    for match in BRACKET_PATTERN.finditer(expr):
+        char = match.group()
         step_info = {
             'step_num': len(steps) + 1,
             'char': char,
-            'position': i,
-            'stack_before': stack.copy(),
+            'position': match.start(),
         }
 
         # Opening bracket - push to stack
-        if char in "({[":
-            stack.append(char)
+        if char in OPENING_BRACKETS:
+            stack.push(char)
             step_info['action'] = 'PUSH'
             step_info['status'] = 'push'
             step_info['message'] = f"Found opening bracket '{char}' -> Push to stack"
@@ -34,15 +193,13 @@ def check_balanced_brackets(expr):
                 step_info['action'] = 'ERROR'
                 step_info['status'] = 'error'
                 step_info['message'] = f"Error: Found closing bracket '{char}' but stack is empty!"
-                step_info['stack_after'] = stack.copy()
                 steps.append(step_info)
                 return False, steps
                 
-            if stack[-1] != bracket_pairs[char]:
+            if stack.peek() != BRACKET_PAIRS[char]:
                 step_info['action'] = 'ERROR'
                 step_info['status'] = 'error'
-                step_info['message'] = f"Error: '{char}' does not match with '{stack[-1]}'"
-                step_info['stack_after'] = stack.copy()
+                step_info['message'] = f"Error: '{char}' does not match with '{stack.peek()}'"
                 steps.append(step_info)
                 return False, steps
             
@@ -51,7 +208,6 @@ def check_balanced_brackets(expr):
             step_info['status'] = 'pop'
             step_info['message'] = f"'{char}' matches with '{matched}' -> Pop from stack"
 
-        step_info['stack_after'] = stack.copy()
         steps.append(step_info)
 
     # Final check
@@ -62,12 +218,22 @@ def check_balanced_brackets(expr):
         'action': 'CHECK',
         'status': 'success' if is_valid else 'error',
         'message': 'Stack is empty -> Expression is valid!' if is_valid else 'Stack is not empty -> Expression is invalid!',
-        'stack_after': stack.copy()
     })
     
     return is_valid, steps
 
 
+def replay_stack(steps):
+    """Yield (step, stack after the step) by replaying the recorded push/pop deltas"""
+    stack = Stack("char")
+    for step in steps:
+        if step.get('action') == 'PUSH':
+            stack.push(step['char'])
+        elif step.get('action') == 'POP':
+            stack.pop()
+        yield step, stack
+
+
 def render_stack_tab():
     st.header("Check Balanced Parentheses")
     
@@ -108,14 +274,14 @@ def render_stack_tab():
     if 'bracket_steps' in st.session_state:
         st.write("### Execution Process:")
         
-        for step in st.session_state['bracket_steps']:
+        for step, stack in replay_stack(st.session_state['bracket_steps']):
             if step.get('char') == 'END':
                 # Final step
                 if step['status'] == 'success':
                     st.success(f"**Step {step['step_num']}**: {step['message']}")
                 else:
                     st.error(f"**Step {step['step_num']}**: {step['message']}")
-                    remaining = step['stack_after'] if step['stack_after'] else []
+                    remaining = stack.to_list()
                     st.write(f"**Remaining Stack:** `{remaining}`")
             else:
                 # Character processing steps
@@ -132,7 +298,7 @@ def render_stack_tab():
                 with col2:
                     st.write(f"**Character:** `{step['char']}` (position {step['position']})")
                     st.write(f"**Action:** {step['action']}")
-                    st.write(f"**Stack:** `{step['stack_after']}`")
+                    st.write(f"**Stack:** `{stack.to_list()}`")
                 
                 with col3:
                     if step['status'] == 'push':
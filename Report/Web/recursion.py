@@ -1,5 +1,6 @@
 import streamlit as st
 import time
+from stack import Stack
 
 def render_stack_tab():
     st.header("Recursion")
@@ -12,7 +13,7 @@ def render_stack_tab():
     
     # Initialize recursion stack in session state
     if "recursion_stack" not in st.session_state:
-        st.session_state['recursion_stack'] = []
+        st.session_state['recursion_stack'] = Stack()
     
     if "is_calculating" not in st.session_state:
         st.session_state['is_calculating'] = False
@@ -29,7 +30,7 @@ def render_stack_tab():
     with col1:        
         if st.button("Calculate Factorial", key="calc_factorial"):
             st.session_state['is_calculating'] = True
-            st.session_state['recursion_stack'] = []
+            st.session_state['recursion_stack'] = Stack()
             st.session_state['final_result'] = None
             st.session_state['current_phase'] = 1
             st.session_state['stack_built'] = False
@@ -55,7 +56,7 @@ def render_stack_tab():
                     'result': None,
                     'depth': factorial_n - i
                 }
-                st.session_state['recursion_stack'].append(call_info)
+                st.session_state['recursion_stack'].push(call_info)
                 
                 # Update stack visualization
                 with stack_placeholder.container():
@@ -183,7 +184,7 @@ def render_stack_tab():
     
     with col1:
         if st.button("Clear", key="clear_recursion"):
-            st.session_state['recursion_stack'] = []
+            st.session_state['recursion_stack'] = Stack()
             st.session_state['is_calculating'] = False
             st.session_state['final_result'] = None
             st.session_state['current_phase'] = 0
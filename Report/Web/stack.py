@@ -0,0 +1,148 @@
+from array import array
+from typing import Iterable, List
+
+
+class Stack:
+    """
+    LIFO stack shared by every tab.
+
+    Elements live in one contiguous buffer that grows geometrically (x2) when full,
+    so push is amortized O(1) and there is no fixed capacity to overflow.
+
+    kind:
+    - "object": any Python value (list buffer)
+    - "int":    64-bit integers in array('q'), 8 bytes per element
+    - "char":   single-byte characters in a bytearray, 1 byte per element
+
+    A typed stack that receives a value it cannot store (an int beyond 64 bits,
+    a non-Latin-1 character) falls back to the "object" buffer instead of failing.
+    """
+    __slots__ = ("_data", "_size", "_kind")
+
+    KINDS = ("object", "int", "char")
+
+    def __init__(self, kind: str = "object", capacity: int = 8):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown stack kind '{kind}', expected one of {self.KINDS}")
+        self._kind = kind
+        self._size = 0
+        self._data = self._allocate(max(capacity, 1))
+
+    def _allocate(self, capacity: int):
+        if self._kind == "int":
+            return array("q", bytes(8 * capacity))
+        if self._kind == "char":
+            return bytearray(capacity)
+        return [None] * capacity
+
+    def _grow(self, needed: int):
+        capacity = len(self._data)
+        while capacity < needed:
+            capacity *= 2
+        self._data.extend(self._allocate(capacity - len(self._data)))
+
+    def _promote(self):
+        # Switch to the generic buffer, keeping the current elements
+        values = self.to_list()
+        self._kind = "object"
+        self._data = values + [None] * (len(self._data) - len(values))
+
+    def _encode(self, value):
+        return ord(value) if self._kind == "char" else value
+
+    def _decode(self, raw):
+        return chr(raw) if self._kind == "char" else raw
+
+    @property
+    def kind(self) -> str:
+        return self._kind
+
+    @property
+    def capacity(self) -> int:
+        return len(self._data)
+
+    def push(self, value):
+        if self._size == len(self._data):
+            self._grow(self._size + 1)
+        try:
+            self._data[self._size] = self._encode(value)
+        except (OverflowError, TypeError, ValueError):
+            self._promote()
+            self._data[self._size] = value
+        self._size += 1
+
+    def push_many(self, values: Iterable):
+        values = list(values)
+        end = self._size + len(values)
+        if end > len(self._data):
+            self._grow(end)
+        try:
+            if self._kind == "int":
+                self._data[self._size:end] = array("q", values)
+            elif self._kind == "char":
+                if any(len(value) != 1 for value in values):
+                    raise ValueError("char stack only holds single characters")
+                self._data[self._size:end] = "".join(values).encode("latin-1")
+            else:
+                self._data[self._size:end] = values
+        except (OverflowError, TypeError, ValueError):
+            self._promote()
+            self._data[self._size:end] = values
+        self._size = end
+
+    def pop(self):
+        if self._size == 0:
+            raise IndexError("pop from empty stack")
+        self._size -= 1
+        value = self._data[self._size]
+        if self._kind == "object":
+            self._data[self._size] = None  # Release the reference
+        return self._decode(value)
+
+    def pop_many(self, count: int) -> List:
+        """Pop count elements at once, returned top first"""
+        if count < 0:
+            raise ValueError(f"count must be non-negative, got {count}")
+        if count > self._size:
+            raise IndexError(f"cannot pop {count} elements from a stack of {self._size}")
+        start = self._size - count
+        values = [self._decode(raw) for raw in reversed(self._data[start:self._size])]
+        if self._kind == "object":
+            self._data[start:self._size] = [None] * count
+        self._size = start
+        return values
+
+    def peek(self):
+        if self._size == 0:
+            raise IndexError("peek from empty stack")
+        return self._decode(self._data[self._size - 1])
+
+    def is_empty(self) -> bool:
+        return self._size == 0
+
+    def clear(self):
+        self._size = 0
+        self._data = self._allocate(8)
+
+    def to_list(self) -> list:
+        """Elements from bottom to top"""
+        return [self._decode(raw) for raw in self._data[:self._size]]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __bool__(self) -> bool:
+        return self._size > 0
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("stack index out of range")
+        return self._decode(self._data[index])
+
+    def __repr__(self) -> str:
+        return f"Stack({self.to_list()!r}, kind={self._kind!r})"